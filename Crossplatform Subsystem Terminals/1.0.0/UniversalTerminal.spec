@@ -1,9 +1,11 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
 
 a = Analysis(
     ['main.py'],
-    pathex=[],
+    # shared/ lives next to the version folders; pathex is not relative to the spec
+    pathex=[os.path.join(SPECPATH, '..')],
     binaries=[],
     datas=[],
     hiddenimports=[],
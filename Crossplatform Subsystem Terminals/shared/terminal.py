@@ -0,0 +1,987 @@
+"""Terminal implementation shared by every release; each version's main.py
+subclasses SimpleTerminal for what differs between them. It can be compiled
+to a C extension with `mypyc shared/terminal.py`.
+"""
+import os
+import re
+import sys
+import stat
+import time
+import shlex
+import fnmatch
+import atexit
+import codecs
+import functools
+import importlib
+import getpass
+import itertools
+import platform
+from collections import deque
+from pathlib import Path
+from typing import (
+    List, Dict, Deque, Tuple, Optional, Callable, Pattern, Type, TypeVar, Final, ClassVar,
+    Any, TYPE_CHECKING,
+)
+
+# subprocess and shutil are imported where they are used: together they
+# pull in threading, signal, selectors and the compression modules, which
+# would otherwise be paid for at startup before the first command
+if TYPE_CHECKING:
+    import subprocess
+
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
+    # only matters when compiled, and mypyc brings mypy_extensions along
+    _T = TypeVar('_T')
+
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> Callable[[_T], _T]:
+        return lambda cls: cls
+
+# The sys.platform checks below are the ones mypy understands, so this
+# module type-checks (and compiles with mypyc) for Windows as well
+try:
+    if sys.platform == 'win32':
+        # provided by pyreadline3; typeshed only describes the POSIX module
+        readline: Any = importlib.import_module('readline')
+    else:
+        import readline
+    _HAVE_READLINE = True
+except ImportError:
+    _HAVE_READLINE = False
+
+_HAVE_TERMIOS: Final = sys.platform != 'win32'
+if sys.platform != 'win32':
+    import termios
+    import tty
+
+# Lines containing any of these need a real shell to interpret them
+_SHELL_META: Final = re.compile(r'[|<>&;`$()*?\[~%#{}!]')
+# The same minus wildcards, which the built-in ls expands itself
+_SHELL_SYNTAX: Final = re.compile(r'[|<>&;`$()~%#{}!]')
+_WILDCARD: Final = re.compile(r'[*?\[]')
+# An absolute path containing none of these is already in normpath() form
+_UNNORMALISED: Final = re.compile(r'[/\\]\.|[/\\]{2}|[/\\]$' + ('|/' if os.altsep else ''))
+
+# Bound once for change_directory, which runs on every cd
+_expanduser: Final = os.path.expanduser
+_isabs: Final = os.path.isabs
+_join: Final = os.path.join
+_normpath: Final = os.path.normpath
+_isdir: Final = os.path.isdir
+
+
+@functools.lru_cache(maxsize=256)
+def _which(name: str) -> Optional[str]:
+    """Cached PATH lookup for bare command names"""
+    import shutil
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=64)
+def _wildcard_regex(pattern: str) -> Pattern[str]:
+    """Compile a shell wildcard once instead of on every match"""
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+def _expand_wildcard(pattern: str, base: str) -> List[str]:
+    """Expand a wildcard in the last path component with a single scandir"""
+    dirname, name = os.path.split(pattern)
+    match = _wildcard_regex(name).match
+    hidden = name.startswith('.')
+    try:
+        with os.scandir(os.path.join(base, dirname)) as it:
+            found = [os.path.join(dirname, e.name) for e in it
+                     if match(e.name) and (hidden or not e.name.startswith('.'))]
+    except OSError:
+        return []
+    return sorted(found)
+
+
+def _path_completions(text: str, base: str) -> List[str]:
+    """Paths under base starting with text; directories end in a separator"""
+    dirname, prefix = os.path.split(text)
+    hidden = prefix.startswith('.')
+    try:
+        with os.scandir(os.path.join(base, dirname)) as it:
+            # is_dir() answers from the directory entry, no stat needed
+            found = [os.path.join(dirname, e.name) + (os.sep if e.is_dir() else '')
+                     for e in it
+                     if e.name.startswith(prefix) and (hidden or not e.name.startswith('.'))]
+    except OSError:
+        return []
+    return sorted(found)
+
+
+def _enable_vt_mode() -> bool:
+    """Let the Windows console interpret ANSI escape sequences"""
+    if sys.platform != 'win32':
+        return False
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
+def _long_entry(name: str, path: str, st: os.stat_result) -> str:
+    """Format one `ls -l` style line"""
+    mtime = time.strftime('%b %d %H:%M', time.localtime(st.st_mtime))
+    if stat.S_ISLNK(st.st_mode):
+        name = f"{name} -> {os.readlink(path)}"
+    return f"{stat.filemode(st.st_mode)} {st.st_size:>10} {mtime} {name}"
+
+
+def _write_encoded(data: bytes) -> None:
+    """Write already encoded text straight to stdout's byte stream"""
+    # anything print() still holds has to come out first
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
+def _history_file() -> Path:
+    """Location of the persistent command history"""
+    cache = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache) / 'xsubsys' / 'history'
+
+
+class _LineEditor:
+    """Raw-mode replacement for input(), used when XSUBSYS_RAW_INPUT=1
+
+    Handles the arrow keys, Home/End/Delete, Ctrl-A/E/K/U/W/L, history on
+    Up/Down and Ctrl-R incremental search. The tty is only raw while a line
+    is read, so the commands that run in between see a normal terminal.
+    """
+    def __init__(self, history: Deque[str]) -> None:
+        self.history = history
+        self._in = sys.stdin.fileno()
+        self._out = sys.stdout.fileno()
+        self._encoding = sys.stdout.encoding or 'utf-8'
+        self._decoder = codecs.getincrementaldecoder(sys.stdin.encoding or 'utf-8')('replace')
+        # decoded input not consumed yet; one read can carry several keys
+        self._pending = ""
+        self._pos = 0
+        self._prompt = ""
+        self._line: List[str] = []
+        self._cursor = 0
+
+    def read_line(self, prompt: str) -> str:
+        """Read one line, raising EOFError and KeyboardInterrupt like input()"""
+        sys.stdout.flush()
+        # only constructed where termios exists; the check is there for mypy
+        if sys.platform != 'win32':
+            saved = termios.tcgetattr(self._in)
+            tty.setraw(self._in)
+            try:
+                return self._edit(prompt)
+            finally:
+                termios.tcsetattr(self._in, termios.TCSADRAIN, saved)
+        return input(prompt)
+
+    def _edit(self, prompt: str) -> str:
+        """The editing loop; the tty is raw"""
+        self._prompt = prompt
+        self._line = []
+        self._cursor = 0
+        # position in history; len(history) is the line being typed
+        index = len(self.history)
+        draft = ""
+        self._redraw()
+        while True:
+            ch = self._key()
+            if ch in '\r\n':
+                self._write('\r\n')
+                return ''.join(self._line)
+            if ch == '\x03':
+                self._write('^C')
+                raise KeyboardInterrupt
+            if ch == '\x04':
+                if not self._line:
+                    raise EOFError
+                del self._line[self._cursor:self._cursor + 1]
+            elif ch >= ' ' and ch != '\x7f':
+                self._line.insert(self._cursor, ch)
+                self._cursor += 1
+                if self._cursor == len(self._line):
+                    # typing at the end of the line only needs an echo
+                    self._write(ch)
+                    continue
+            elif ch in '\x7f\x08':
+                if self._cursor:
+                    self._cursor -= 1
+                    del self._line[self._cursor]
+            elif ch == '\x01':
+                self._cursor = 0
+            elif ch == '\x05':
+                self._cursor = len(self._line)
+            elif ch == '\x0b':
+                del self._line[self._cursor:]
+            elif ch == '\x15':
+                del self._line[:self._cursor]
+                self._cursor = 0
+            elif ch == '\x17':
+                start = self._cursor
+                while start and self._line[start - 1] == ' ':
+                    start -= 1
+                while start and self._line[start - 1] != ' ':
+                    start -= 1
+                del self._line[start:self._cursor]
+                self._cursor = start
+            elif ch == '\x0c':
+                self._write('\x1b[2J\x1b[H')
+            elif ch == '\x12':
+                if self._search():
+                    self._redraw()
+                    self._write('\r\n')
+                    return ''.join(self._line)
+            elif ch == '\x1b':
+                seq = self._escape()
+                if seq in ('[A', 'OA'):
+                    if index > 0:
+                        if index == len(self.history):
+                            draft = ''.join(self._line)
+                        index -= 1
+                        self._set_line(self.history[index])
+                elif seq in ('[B', 'OB'):
+                    if index < len(self.history):
+                        index += 1
+                        self._set_line(self.history[index] if index < len(self.history) else draft)
+                elif seq in ('[C', 'OC'):
+                    self._cursor = min(self._cursor + 1, len(self._line))
+                elif seq in ('[D', 'OD'):
+                    self._cursor = max(self._cursor - 1, 0)
+                elif seq in ('[H', 'OH', '[1~', '[7~'):
+                    self._cursor = 0
+                elif seq in ('[F', 'OF', '[4~', '[8~'):
+                    self._cursor = len(self._line)
+                elif seq == '[3~':
+                    del self._line[self._cursor:self._cursor + 1]
+            self._redraw()
+
+    def _search(self) -> bool:
+        """Ctrl-R search; leaves the match on the line, True if Enter ended it"""
+        query = match = ""
+        found = len(self.history)
+        while True:
+            self._write(f"\r(reverse-i-search)`{query}': {match}\x1b[K")
+            ch = self._key()
+            if ch == '\x03':
+                self._write('^C')
+                raise KeyboardInterrupt
+            if ch == '\x07':
+                # Ctrl-G gives up and keeps what was being typed
+                return False
+            if ch in '\x7f\x08':
+                query = query[:-1]
+                start = len(self.history) - 1
+            elif ch == '\x12':
+                start = found - 1
+            elif ch >= ' ':
+                query += ch
+                start = min(found, len(self.history) - 1)
+            else:
+                # any other key ends the search with the match on the line
+                self._set_line(match)
+                return ch in '\r\n'
+            for i in range(start, -1, -1):
+                if query in self.history[i]:
+                    found = i
+                    match = self.history[i]
+                    break
+
+    def _escape(self) -> str:
+        """Read the rest of an escape sequence, e.g. '[A' for Up"""
+        seq = self._key()
+        if seq not in '[O':
+            return seq
+        while True:
+            ch = self._key()
+            seq += ch
+            # parameters are digits and ';', anything else ends the sequence
+            if not (ch.isdigit() or ch == ';'):
+                return seq
+
+    def _key(self) -> str:
+        """Next character typed, reading from the tty when none is pending"""
+        while self._pos >= len(self._pending):
+            data = os.read(self._in, 256)
+            if not data:
+                # the tty went away (hangup); there is nothing left to edit
+                raise EOFError
+            self._pending = self._decoder.decode(data)
+            self._pos = 0
+        ch = self._pending[self._pos]
+        self._pos += 1
+        return ch
+
+    def _set_line(self, text: str) -> None:
+        """Replace the line being edited, cursor at the end"""
+        self._line = list(text)
+        self._cursor = len(self._line)
+
+    def _redraw(self) -> None:
+        """Repaint the prompt and line and put the cursor back"""
+        back = len(self._line) - self._cursor
+        self._write(f"\r{self._prompt}{''.join(self._line)}\x1b[K"
+                    + (f"\x1b[{back}D" if back else ""))
+
+    def _write(self, text: str) -> None:
+        """Write to the tty, bypassing sys.stdout"""
+        os.write(self._out, text.encode(self._encoding, 'replace'))
+
+
+# The version launchers subclass these from interpreted code
+@mypyc_attr(allow_interpreted_subclasses=True)
+class SimpleTerminal:
+    """Platform-independent terminal; see versioned_terminal() for the real one"""
+    # Command aliases, extended per platform by the subclasses below
+    ALIASES: ClassVar[Dict[str, str]] = {
+        'll': 'ls -la',
+        'la': 'ls -a',
+        'cls': 'clear',
+        'md': 'mkdir',
+        'rd': 'rmdir',
+        '..': 'cd ..',
+        '...': 'cd ../..',
+        '....': 'cd ../../..',
+    }
+    PROMPT_FORMAT: ClassVar[str] = "{u}@{h}:{d}$ "
+    LIST_COMMAND: ClassVar[str] = 'ls'
+    # shlex quoting rules of the platform shell
+    POSIX_SYNTAX: ClassVar[bool] = True
+    # Whether the platform shell matches command names regardless of case
+    CASE_INSENSITIVE: ClassVar[bool] = False
+    # Banner lines under the platform line, and the reply to Ctrl-C
+    HINTS: ClassVar[Tuple[str, ...]] = ("Type 'help' for commands, 'exit' to quit",)
+    INTERRUPT_HINT: ClassVar[str] = "Use 'exit' to quit"
+    # show_help output, kept as bytes so it is never re-encoded; ASCII only
+    HELP_TEXT: ClassVar[bytes] = b"""
+Simple Cross-Platform Terminal
+------------------------------
+Basic Commands:
+  cd [directory]   - Change directory
+  ls / dir         - List directory contents
+  pwd              - Show current directory
+  clear / cls      - Clear screen
+  exit / quit      - Exit terminal
+Aliases:
+  ll  - ls -la / dir with details
+  la  - ls -a
+  ..  - cd ..
+
+"""
+
+    def __init__(self) -> None:
+        self.current_dir = os.getcwd()
+        system = platform.system()
+        self.system: Final = system.lower()
+        # Only used without readline, which keeps its own history; bounded
+        # so a long session cannot grow it without limit
+        self.history: Deque[str] = deque(maxlen=1000)
+        self.history_index = -1
+        self.aliases: Final = self.ALIASES
+        # Prompt pieces that never change during a session
+        try:
+            self._user = os.getlogin()
+        except OSError:
+            # no controlling terminal or utmp entry
+            self._user = getpass.getuser()
+        self._host = platform.node()
+        rule = "=" * 50
+        self._banner = "\n".join([
+            rule,
+            "Simple Cross-Platform Terminal",
+            f"Running on: {system} {platform.release()}",
+            *self.HINTS,
+            rule,
+            "",
+        ]).encode(sys.stdout.encoding or 'utf-8', 'replace')
+        # The prompt only changes on cd, so it is rebuilt there, not per line
+        self._prompt = ""
+        self._rebuild_prompt()
+        # Internal commands, keyed on the first word (lowercase on Windows)
+        self._builtins = self._make_builtins()
+        # Aliases and internal commands in one table, so a line costs a
+        # single lookup. Two-word aliases ('mkdir -p') hang off their first
+        # word and are resolved by the handler.
+        self._dispatch: Dict[str, Callable[[str], bool]] = dict(self._builtins)
+        by_head: Dict[str, Dict[str, str]] = {}
+        for name, value in self.aliases.items():
+            head, _, second = name.partition(' ')
+            by_head.setdefault(head, {})[second] = value
+        for head, entries in by_head.items():
+            self._dispatch[head] = self._alias_handler(head, entries)
+        # Line editing only applies when stdin is a terminal. The raw-mode
+        # editor is opt-in, and the only one available without readline.
+        interactive = sys.stdin.isatty()
+        self._editor: Optional[_LineEditor] = None
+        if _HAVE_TERMIOS and interactive and (
+                os.environ.get('XSUBSYS_RAW_INPUT') == '1' or not _HAVE_READLINE):
+            self._editor = _LineEditor(self.history)
+        self._use_readline = _HAVE_READLINE and interactive and self._editor is None
+        if self._use_readline:
+            self._setup_readline()
+
+    def _make_builtins(self) -> Dict[str, Callable[[str], bool]]:
+        """Internal commands; versions extend this table"""
+        return {
+            'cd': self._cd,
+            'exit': self._exit,
+            'quit': self._exit,
+            'clear': self._clear,
+            'cls': self._clear,
+            'pwd': self._pwd,
+            'ls': self._ls,
+            'dir': self._ls,
+            'help': self._help,
+        }
+
+    def _setup_readline(self) -> None:
+        """Persistent history and tab completion via readline"""
+        histfile = str(_history_file())
+        # drop anything typed before the terminal started (e.g. the mode menu)
+        readline.clear_history()
+        try:
+            os.makedirs(os.path.dirname(histfile), exist_ok=True)
+            readline.read_history_file(histfile)
+        except OSError:
+            pass
+        readline.set_history_length(10000)
+        atexit.register(self._save_history, histfile)
+
+        readline.set_completer(self._complete)
+        readline.set_completer_delims(' \t\n;|&<>')
+        if 'libedit' in (readline.__doc__ or ''):
+            readline.parse_and_bind('bind ^I rl_complete')
+        else:
+            readline.parse_and_bind('tab: complete')
+        self._matches: List[str] = []
+
+    def _save_history(self, histfile: str) -> None:
+        """Write readline history back to disk"""
+        try:
+            readline.write_history_file(histfile)
+        except OSError:
+            pass
+
+    def _complete(self, text: str, state: int) -> Optional[str]:
+        """Complete command names first, then file names"""
+        if state == 0:
+            if readline.get_begidx() == 0:
+                names = set(self.aliases) | set(self._builtins)
+                self._matches = sorted(n for n in names if n.startswith(text))
+            else:
+                self._matches = []
+            self._matches += _path_completions(text, self.current_dir)
+        if state < len(self._matches):
+            return self._matches[state]
+        return None
+
+    def clear_screen(self) -> None:
+        """Clear the terminal screen"""
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+
+    def get_prompt(self) -> str:
+        """Generate the command prompt"""
+        return self._prompt
+
+    def _rebuild_prompt(self) -> None:
+        """Format the prompt for the current directory"""
+        # Simple prompt without colors for maximum compatibility
+        self._prompt = self.PROMPT_FORMAT.format(
+            u=self._user, h=self._host, d=os.path.basename(self.current_dir)
+        )
+
+    def _alias_handler(self, head: str, entries: Dict[str, str]) -> Callable[[str], bool]:
+        """Build the dispatch entry for the aliases starting with `head`"""
+        builtin = self._builtins.get(head)
+
+        def handler(rest: str) -> bool:
+            second, sep, tail = rest.partition(' ')
+            if second and second in entries:
+                return self._run_expanded(entries[second] + sep + tail)
+            if '' in entries:
+                return self._run_expanded(entries[''] + (' ' + rest if rest else ''))
+            # only a two-word alias shares this head, and it did not match
+            if builtin is not None:
+                return builtin(rest)
+            return self._spawn(head + ' ' + rest if rest else head)
+
+        return handler
+
+    def change_directory(self, path: str) -> bool:
+        """Change directory"""
+        try:
+            # Handle special paths
+            if path == "~":
+                path = str(Path.home())
+            elif path == "-":
+                # Simple back navigation - go to previous directory
+                previous = os.path.dirname(self.current_dir)
+                if previous != self.current_dir:
+                    path = previous
+                else:
+                    print("Already at root directory")
+                    return True
+
+            # Expand home directory
+            if path.startswith('~'):
+                path = _expanduser(path)
+
+            # Fast path: absolute and already normalised
+            if not _isabs(path):
+                path = _normpath(_join(self.current_dir, path))
+            elif _UNNORMALISED.search(path):
+                path = _normpath(path)
+
+            if _isdir(path):
+                os.chdir(path)
+                # path is already absolute and normalised; keep it as the
+                # logical cwd (like a shell's $PWD) instead of asking getcwd()
+                self.current_dir = path
+                self._rebuild_prompt()
+                return True
+            else:
+                print(f"Directory not found: {path}")
+                return False
+
+        except Exception as e:
+            print(f"Error changing directory: {e}")
+            return False
+
+    def list_directory(self, args: str = "") -> None:
+        """Handle directory listing"""
+        native = f"{self.LIST_COMMAND} {args}"
+        try:
+            parts = shlex.split(args, posix=self.POSIX_SYNTAX)
+        except ValueError:
+            parts = None
+        # pipes, redirects and quoting problems are left to the real command
+        if parts is None or _SHELL_SYNTAX.search(args):
+            self._spawn(native)
+            return
+
+        show_all = long_format = False
+        targets: List[str] = []
+        for arg in parts:
+            if arg.startswith('-') and len(arg) > 1:
+                if not set(arg[1:]) <= set('al'):
+                    self._spawn(native)
+                    return
+                show_all = show_all or 'a' in arg
+                long_format = long_format or 'l' in arg
+            elif self._is_native_switch(arg):
+                self._spawn(native)
+                return
+            else:
+                targets.append(arg.strip('"'))
+
+        expanded: List[str] = []
+        for target in targets or ['.']:
+            if _WILDCARD.search(os.path.dirname(target)):
+                # only the last component is expanded here
+                self._spawn(native)
+                return
+            matches = _expand_wildcard(target, self.current_dir) if _WILDCARD.search(target) else []
+            # like the shell, an unmatched pattern is passed through as is
+            expanded += matches or [target]
+
+        # files (and missing paths) first, then each directory, like ls
+        dirs = {t for t in expanded if os.path.isdir(os.path.join(self.current_dir, t))}
+        files = [t for t in expanded if t not in dirs]
+        for target in files:
+            self._print_listing(target, show_all, long_format)
+        for i, target in enumerate(t for t in expanded if t in dirs):
+            if len(expanded) > 1:
+                print(("\n" if files or i else "") + f"{target}:")
+            self._print_listing(target, show_all, long_format)
+
+    def _is_native_switch(self, arg: str) -> bool:
+        """Whether arg is a listing switch only the native command understands"""
+        return False
+
+    def _print_listing(self, target: str, show_all: bool, long_format: bool) -> None:
+        """Print one directory, or a single file, for list_directory"""
+        path = os.path.join(self.current_dir, target)
+        try:
+            if not os.path.isdir(path):
+                st = os.lstat(path)
+                print(_long_entry(target, path, st) if long_format else target)
+                return
+
+            with os.scandir(path) as it:
+                entries = [e for e in it if show_all or not e.name.startswith('.')]
+            entries.sort(key=lambda e: e.name.lower())
+            if long_format:
+                lines = [_long_entry(e.name, e.path, e.stat(follow_symlinks=False))
+                         for e in entries]
+            else:
+                lines = [e.name for e in entries]
+            if lines:
+                # one write and one flush for the whole listing; the empty
+                # last item supplies the trailing newline without a copy
+                lines.append('')
+                sys.stdout.write('\n'.join(lines))
+                sys.stdout.flush()
+        except OSError as e:
+            print(f"Error listing directory: {e}")
+
+    def execute_command(self, command: str) -> bool:
+        """Execute a command"""
+        if not command.strip():
+            return True
+
+        # Aliases and internal commands
+        head, _, rest = command.partition(' ')
+        fn = self._dispatch.get(head.lower() if self.CASE_INSENSITIVE else head)
+        if fn:
+            return fn(rest)
+
+        # Execute external command
+        return self._spawn(command)
+
+    def _run_expanded(self, command: str) -> bool:
+        """Run an alias expansion; aliases are not expanded again"""
+        head, _, rest = command.partition(' ')
+        fn = self._builtins.get(head.lower() if self.CASE_INSENSITIVE else head)
+        if fn:
+            return fn(rest)
+        return self._spawn(command)
+
+    def _cd(self, args: str) -> bool:
+        """cd [directory] - defaults to the home directory"""
+        path = args.strip()
+        return self.change_directory(path or str(Path.home()))
+
+    def _exit(self, args: str) -> bool:
+        """exit / quit"""
+        print("Goodbye!")
+        return False
+
+    def _clear(self, args: str) -> bool:
+        """clear / cls"""
+        self.clear_screen()
+        return True
+
+    def _pwd(self, args: str) -> bool:
+        """pwd"""
+        print(self.current_dir)
+        return True
+
+    def _ls(self, args: str) -> bool:
+        """ls / dir"""
+        self.list_directory(args)
+        return True
+
+    def recent_history(self, count: int) -> List[str]:
+        """Return the last `count` commands, oldest first"""
+        if not self._use_readline:
+            start = max(0, len(self.history) - count)
+            return list(itertools.islice(self.history, start, None))
+        length = readline.get_current_history_length()
+        first = max(1, length - count + 1)
+        return [readline.get_history_item(i) for i in range(first, length + 1)]
+
+    def _help(self, args: str) -> bool:
+        """help"""
+        self.show_help()
+        return True
+
+    def _spawn(self, command: str) -> bool:
+        """Run an external command, only going through the shell when needed"""
+        argv: Optional[List[str]] = None
+        if not _SHELL_META.search(command):
+            try:
+                argv = shlex.split(command, posix=self.POSIX_SYNTAX)
+            except ValueError:
+                argv = None
+
+        executable: Optional[str] = None
+        if argv:
+            # Explicit paths are left for exec to resolve against the cwd
+            executable = argv[0] if os.path.dirname(argv[0]) else _which(argv[0])
+
+        try:
+            if argv is None or executable is None:
+                # Shell builtins, pipes and redirects - use the system shell
+                self._run_in_shell(command)
+            else:
+                self._exec(command, argv, executable)
+        except Exception as e:
+            print(f"Error executing command: {e}")
+        return True
+
+    def _exec(self, command: str, argv: List[str], executable: str) -> None:
+        """Run a resolved program without a shell"""
+        # Every fd Python opens is non-inheritable (PEP 446), so there is
+        # nothing to close in the child. Skipping the close loop, and relying
+        # on our own cwd (change_directory keeps it in sync) instead of
+        # passing cwd=, lets subprocess use posix_spawn instead of fork + exec.
+        import subprocess
+        subprocess.call(argv, executable=executable, close_fds=False)
+
+    def _run_in_shell(self, command: str) -> None:
+        """Run a line through the system shell"""
+        import subprocess
+        subprocess.call(command, shell=True, close_fds=False)
+
+    def show_help(self) -> None:
+        """Show help information"""
+        _write_encoded(self.HELP_TEXT)
+
+    def run(self) -> None:
+        """Main terminal loop"""
+        _write_encoded(self._banner)
+
+        while True:
+            try:
+                prompt = self.get_prompt()
+                if self._editor is not None:
+                    command = self._editor.read_line(prompt).strip()
+                else:
+                    command = input(prompt).strip()
+
+                if command:
+                    # readline records the line itself
+                    if not self._use_readline:
+                        self.history.append(command)
+
+                    if not self.execute_command(command):
+                        break
+
+            except KeyboardInterrupt:
+                print("\n" + self.INTERRUPT_HINT)
+                continue
+
+            except EOFError:
+                print("\nGoodbye!")
+                break
+
+            except Exception as e:
+                print(f"Error: {e}")
+                continue
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class PosixTerminal(SimpleTerminal):
+    """Linux and other POSIX systems"""
+    def __init__(self) -> None:
+        super().__init__()
+        # Long-lived bash for lines that need a shell, started on first use
+        self._shell: Optional["subprocess.Popen[str]"] = None
+        self._shell_fds = (-1, -1)  # (stdin for commands, status pipe) in the child
+        self._status_fd = -1
+        atexit.register(self._close_shell)
+
+    def change_directory(self, path: str) -> bool:
+        """Change directory, keeping the coprocess in step"""
+        if not super().change_directory(path):
+            return False
+        if self._shell is not None:
+            self._shell_send(f"cd -- {shlex.quote(self.current_dir)}")
+        return True
+
+    def _exec(self, command: str, argv: List[str], executable: str) -> None:
+        """Run a resolved program with a single posix_spawn"""
+        if sys.platform == 'win32' or not hasattr(os, 'posix_spawn'):
+            super()._exec(command, argv, executable)
+            return
+        import signal
+        # The child inherits our stdio, environment and cwd. Python ignores
+        # SIGPIPE and SIGXFSZ, so restore their defaults the way subprocess does.
+        pid = os.posix_spawn(executable, argv, os.environ,
+                             setsigdef=(signal.SIGPIPE, signal.SIGXFSZ))
+        interrupted = False
+        while True:
+            try:
+                os.waitpid(pid, 0)
+                break
+            except KeyboardInterrupt:
+                # The program got the same SIGINT; wait for it like a shell would
+                interrupted = True
+        if interrupted:
+            print()
+
+    def _run_in_shell(self, command: str) -> None:
+        """Run a line through the persistent shell, starting it if needed"""
+        if self._shell is None and not self._start_shell():
+            super()._run_in_shell(command)
+            return
+
+        # The line is passed quoted to eval so a syntax error can never leave
+        # bash waiting for more input. Commands get our stdin back and do not
+        # inherit the protocol fds. Each line runs in a subshell, so variables,
+        # functions and the directory stack do not outlive it, just as with a
+        # fresh shell per line; only its final directory is reported back,
+        # ahead of the exit status, which the parent bash always sends. The
+        # subshell keeps the default SIGINT action, so Ctrl-C ends the whole
+        # line as with `sh -c`; only the parent bash ignores it.
+        stdin_fd, status_fd = self._shell_fds
+        self._shell_send(
+            f"( eval {shlex.quote(command)} <&{stdin_fd} {stdin_fd}<&- {status_fd}>&-; "
+            f"s=$?; printf '%s\\0' \"$PWD\" >&{status_fd}; exit $s )\n"
+            f"printf '%d\\0' \"$?\" >&{status_fd}"
+        )
+        if self._shell is None:
+            # bash died before taking the line
+            super()._run_in_shell(command)
+            return
+
+        reply = b""
+        interrupted = False
+        while True:
+            try:
+                chunk = os.read(self._status_fd, 4096)
+            except KeyboardInterrupt:
+                # The command got the same SIGINT; wait for it like a shell would
+                interrupted = True
+                continue
+            if not chunk:
+                # bash went away
+                self._close_shell()
+                break
+            reply += chunk
+            # done once the last complete item is the status, not a path
+            if reply.endswith(b"\0") and not reply.rsplit(b"\0", 2)[-2].startswith(b"/"):
+                break
+        if interrupted:
+            print()
+
+        items = reply.split(b"\0")
+        if len(items) == 3:
+            # follow a cd, pushd etc. made by the line
+            cwd = os.fsdecode(items[0])
+            if cwd != self.current_dir:
+                self.change_directory(cwd)
+
+    def _start_shell(self) -> bool:
+        """Start the coprocess used for lines that need a shell"""
+        bash = _which('bash')
+        if bash is None:
+            return False
+        try:
+            stdin_fd = os.dup(0)
+        except OSError:
+            return False
+        import subprocess
+        status_r, status_w = os.pipe()
+        try:
+            self._shell = subprocess.Popen(
+                [bash, '--noprofile', '--norc'],
+                stdin=subprocess.PIPE,
+                cwd=self.current_dir,
+                # current_dir is logical; without a matching $PWD bash would
+                # fall back to the physical path and report that back
+                env={**os.environ, 'PWD': self.current_dir},
+                # pass_fds implies close_fds, but this runs once per session
+                pass_fds=(stdin_fd, status_w),
+                text=True,
+            )
+        except OSError:
+            os.close(status_r)
+            return False
+        finally:
+            os.close(stdin_fd)
+            os.close(status_w)
+        self._shell_fds = (stdin_fd, status_w)
+        self._status_fd = status_r
+        # Ctrl-C should stop the running command, not the shell
+        self._shell_send("trap : INT")
+        return True
+
+    def _shell_send(self, line: str) -> None:
+        """Write one line to the coprocess"""
+        stdin = self._shell.stdin if self._shell is not None else None
+        if stdin is None:
+            return
+        try:
+            stdin.write(line + "\n")
+            stdin.flush()
+        except OSError:
+            self._close_shell()
+
+    def _close_shell(self) -> None:
+        """Shut down the coprocess; the next shell line starts a new one"""
+        shell, self._shell = self._shell, None
+        if shell is None:
+            return
+        os.close(self._status_fd)
+        try:
+            if shell.stdin is not None:
+                shell.stdin.close()
+        except OSError:
+            pass
+        shell.wait()
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class DarwinTerminal(PosixTerminal):
+    """macOS"""
+    PROMPT_FORMAT = "{u}@{h} {d} % "
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class WindowsTerminal(SimpleTerminal):
+    """Windows console (cmd.exe semantics)"""
+    ALIASES = {
+        **SimpleTerminal.ALIASES,
+        'ls': 'dir',
+        'rm': 'del',
+        'cp': 'copy',
+        'mv': 'move',
+        'cat': 'type',
+        'mkdir -p': 'mkdir',
+    }
+    PROMPT_FORMAT = "PS {d}> "
+    LIST_COMMAND = 'dir'
+    POSIX_SYNTAX = False
+    CASE_INSENSITIVE = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        # clear_screen writes ANSI directly; old consoles lack VT mode
+        self._ansi = _enable_vt_mode()
+
+    def clear_screen(self) -> None:
+        """Clear the terminal screen"""
+        if self._ansi:
+            super().clear_screen()
+        else:
+            os.system('cls')
+
+    def _is_native_switch(self, arg: str) -> bool:
+        """dir /switches"""
+        return arg.startswith('/')
+
+    def _exec(self, command: str, argv: List[str], executable: str) -> None:
+        """Run a resolved program without a shell"""
+        # _which() also finds .cmd/.bat through PATHEXT, but CreateProcess
+        # can only start real executables; the rest need cmd.exe
+        if not executable.lower().endswith(('.exe', '.com')):
+            self._run_in_shell(command)
+            return
+        # CreateProcess parses the line itself, pass it as typed
+        import subprocess
+        subprocess.call(command, cwd=self.current_dir, close_fds=False)
+
+
+def terminal_class() -> Type[SimpleTerminal]:
+    """Pick the terminal implementation for the running platform"""
+    if sys.platform == 'win32':
+        return WindowsTerminal
+    if sys.platform == 'darwin':
+        return DarwinTerminal
+    return PosixTerminal
+
+
+def versioned_terminal(version: Type[SimpleTerminal]) -> Type[SimpleTerminal]:
+    """Combine a release's SimpleTerminal subclass with the platform class"""
+    return type(version.__name__, (version, terminal_class()), {})